@@ -7,11 +7,13 @@ sys.path.append(str(ROOT / "src"))
 
 from scripts.run_quadratic_benchmark import main as quad_main
 from scripts.run_piecewise1d_demo import main as pw_main
+from scripts.run_finite_sum_benchmark import main as fs_main
 
 
 def main() -> None:
     quad_main()
     pw_main()
+    fs_main()
 
 
 if __name__ == "__main__":
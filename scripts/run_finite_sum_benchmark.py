@@ -0,0 +1,140 @@
+from __future__ import annotations
+from pathlib import Path
+import sys
+import time
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from aglab.config import ensure_figures_dir
+from aglab.objectives.finite_sum import LeastSquaresFiniteSum, LogisticFiniteSum
+from aglab.optim.gd import gradient_descent_fixed
+from aglab.optim.heavy_ball import heavy_ball
+from aglab.optim.nesterov import nesterov_strongly_convex
+from aglab.optim.stochastic import stochastic_heavy_ball, svrg, katyusha
+from aglab.plotting.lines import semilog_xy
+
+
+def _stop_on_gap(eps: float, f_star: float):
+    def stop(k: int, x: np.ndarray, fx: float) -> bool:
+        return (fx - f_star) <= eps
+    return stop
+
+
+def _make_data(n: int, d: int, cond: float, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Gaussian rows with column scales spread over [1/sqrt(cond), 1], already in random row order."""
+    rng = np.random.default_rng(seed)
+    scales = np.logspace(0.0, -0.5 * np.log10(cond), d)
+    X = rng.standard_normal((n, d)) * scales
+    w_true = rng.standard_normal((d,))
+    y = X @ w_true + 0.1 * rng.standard_normal((n,))
+    return X, y
+
+
+def _run_all(obj, f_star: float, mu: float, epsilon: float, batch_size: int, max_epochs: int, seed: int):
+    """Runs every method from x0 = 0 and returns {name: (seconds, hist, passes per record)}."""
+    d = obj.X.shape[1]
+    n = obj.n_samples
+    x0 = np.zeros((d,))
+
+    L = obj.smoothness()
+    L_B = obj.batch_smoothness(batch_size)
+    beta_acc = (np.sqrt(L) - np.sqrt(mu)) / (np.sqrt(L) + np.sqrt(mu))
+
+    runs = {
+        "GD 1/L": lambda stop: gradient_descent_fixed(
+            obj.f, obj.grad, x0, alpha=1.0 / L, max_iter=max_epochs, stop=stop),
+        "Heavy-Ball (tuned)": lambda stop: heavy_ball(
+            obj.f, obj.grad, x0, alpha=4.0 / (np.sqrt(L) + np.sqrt(mu)) ** 2, beta=beta_acc,
+            max_iter=max_epochs, stop=stop),
+        "Nesterov (tuned)": lambda stop: nesterov_strongly_convex(
+            obj.f, obj.grad, x0, alpha=1.0 / L, beta=beta_acc, max_iter=max_epochs, stop=stop),
+        "SGD+momentum": lambda stop: stochastic_heavy_ball(
+            obj.f, obj.grad_batch, n, x0, alpha=0.1 / L_B, beta=0.9, batch_size=batch_size,
+            max_epochs=max_epochs, stop=stop, seed=seed),
+        "SVRG": lambda stop: svrg(
+            obj.f, obj.grad_batch, n, x0, alpha=1.0 / (4.0 * L_B), batch_size=batch_size,
+            max_epochs=max_epochs, stop=stop, seed=seed),
+        "Katyusha": lambda stop: katyusha(
+            obj.f, obj.grad_batch, n, x0, L=L_B, mu=mu, batch_size=batch_size,
+            max_epochs=max_epochs, stop=stop, seed=seed),
+    }
+
+    out = {}
+    for name, run in runs.items():
+        t0 = time.perf_counter()
+        hist = run(_stop_on_gap(epsilon, f_star))
+        seconds = time.perf_counter() - t0
+        # Full-gradient methods spend one pass over the data per iteration
+        passes = getattr(hist, "passes", np.arange(hist.fvals.size, dtype=float))
+        out[name] = (seconds, hist, passes)
+    return out
+
+
+def _report(title: str, results, f_star: float, epsilon: float) -> None:
+    print(f"=== {title} ===")
+    for name, (seconds, hist, passes) in results.items():
+        reached = (hist.fvals[-1] - f_star) <= epsilon
+        status = f"time-to-eps={seconds:7.3f}s" if reached else f"not reached ({seconds:.3f}s)"
+        print(f"{name:20s} {status}  passes={passes[-1]:7.1f}  gap={hist.fvals[-1] - f_star:.3e}")
+
+
+def main() -> None:
+    figs = ensure_figures_dir()
+
+    n = 200000
+    d = 100
+    batch_size = 256
+    reg = 1e-4
+    epsilon = 1e-8
+    max_epochs = 500
+    seed = 7
+
+    X, y = _make_data(n=n, d=d, cond=1e3, seed=seed)
+
+    # -------------------------
+    # Least squares: f* and mu from the (d x d) normal equations
+    # -------------------------
+    ls = LeastSquaresFiniteSum(X=X, y=y, reg=reg)
+    f_star = ls.f(ls.minimizer())
+    mu = float(np.linalg.eigvalsh(X.T @ X / n).min()) + reg
+
+    results = _run_all(ls, f_star, mu, epsilon, batch_size, max_epochs, seed)
+    print(f"n={n}, d={d}, batch={batch_size}, L={ls.smoothness():.4g}, mu={mu:.4g}, epsilon={epsilon:g}")
+    _report("Finite-sum least squares", results, f_star, epsilon)
+    semilog_xy(
+        {name: (passes, hist.fvals - f_star) for name, (_, hist, passes) in results.items()},
+        figs / "finite_sum_least_squares_passes.png",
+        xlabel="Passes over the data",
+        ylabel="Optimality gap f(x)-f*",
+    )
+
+    # -------------------------
+    # Logistic regression: mu = reg, f* from a long Nesterov reference run
+    # -------------------------
+    lr = LogisticFiniteSum(X=X, y=np.sign(y), reg=1e-3)
+    mu_lr = lr.reg
+    L_lr = lr.smoothness()
+    beta_ref = (np.sqrt(L_lr) - np.sqrt(mu_lr)) / (np.sqrt(L_lr) + np.sqrt(mu_lr))
+    ref = nesterov_strongly_convex(
+        lr.f, lr.grad, np.zeros((d,)), alpha=1.0 / L_lr, beta=beta_ref, max_iter=5000,
+        stop=lambda k, x, fx: np.linalg.norm(lr.grad(x)) <= 1e-10,
+    )
+    f_star_lr = float(ref.fvals.min())
+
+    results_lr = _run_all(lr, f_star_lr, mu_lr, epsilon, batch_size, max_epochs, seed)
+    print()
+    _report("Finite-sum logistic regression", results_lr, f_star_lr, epsilon)
+    semilog_xy(
+        {name: (passes, np.maximum(hist.fvals - f_star_lr, 0.0)) for name, (_, hist, passes) in results_lr.items()},
+        figs / "finite_sum_logistic_passes.png",
+        xlabel="Passes over the data",
+        ylabel="Optimality gap f(x)-f*",
+    )
+
+    print(f"\nSaved figures to: {figs}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
 from .quadratic import Quadratic, make_symmetric_psd_with_spectrum
 from .piecewise1d import PiecewiseStronglyConvex1D
+from .finite_sum import LeastSquaresFiniteSum, LogisticFiniteSum
 
-__all__ = ["Quadratic", "make_symmetric_psd_with_spectrum", "PiecewiseStronglyConvex1D"]
+__all__ = [
+    "Quadratic",
+    "make_symmetric_psd_with_spectrum",
+    "PiecewiseStronglyConvex1D",
+    "LeastSquaresFiniteSum",
+    "LogisticFiniteSum",
+]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+
+def _block_gram_lambda_max(X: np.ndarray, batch_size: int) -> float:
+    """max over contiguous blocks B of lambda_max(X_B^T X_B / |B|)."""
+    if batch_size == 1:
+        return float(np.einsum("ij,ij->i", X, X).max())
+    n = X.shape[0]
+    return max(
+        float(np.linalg.eigvalsh(X[s:s + batch_size].T @ X[s:s + batch_size]).max()) / min(batch_size, n - s)
+        for s in range(0, n, batch_size)
+    )
+
+def _c_contiguous_rows(X: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    X = np.ascontiguousarray(X, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float).ravel()
+    if X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError(f"X must be (n, d) with len(y) == n, got X{X.shape} and y{y.shape}")
+    return X, y
+
+
+@dataclass(frozen=True)
+class LeastSquaresFiniteSum:
+    """
+    f(x) = (1/n) sum_i 0.5 (a_i^T x - y_i)^2 + 0.5 reg ||x||^2
+
+    a_i is row i of X. X is stored C-contiguous, so the minibatch oracles
+    operate on zero-copy views X[start:stop]. Shuffle the rows once up front
+    if the data is ordered: the stochastic methods sample contiguous blocks.
+    """
+    X: np.ndarray
+    y: np.ndarray
+    reg: float = 0.0
+
+    def __post_init__(self) -> None:
+        X, y = _c_contiguous_rows(self.X, self.y)
+        object.__setattr__(self, "X", X)
+        object.__setattr__(self, "y", y)
+
+    @property
+    def n_samples(self) -> int:
+        return self.X.shape[0]
+
+    def f_batch(self, x: np.ndarray, start: int, stop: int) -> float:
+        x = np.asarray(x, float)
+        r = self.X[start:stop] @ x - self.y[start:stop]
+        return float(0.5 * (r @ r) / r.shape[0] + 0.5 * self.reg * (x @ x))
+
+    def grad_batch(self, x: np.ndarray, start: int, stop: int) -> np.ndarray:
+        x = np.asarray(x, float)
+        Xb = self.X[start:stop]
+        r = Xb @ x - self.y[start:stop]
+        return Xb.T @ r / r.shape[0] + self.reg * x
+
+    def f(self, x: np.ndarray) -> float:
+        return self.f_batch(x, 0, self.n_samples)
+
+    def grad(self, x: np.ndarray) -> np.ndarray:
+        return self.grad_batch(x, 0, self.n_samples)
+
+    def smoothness(self) -> float:
+        """L of the full objective: lambda_max(X^T X / n) + reg."""
+        return float(np.linalg.eigvalsh(self.X.T @ self.X).max() / self.n_samples + self.reg)
+
+    def batch_smoothness(self, batch_size: int) -> float:
+        """Smoothness bound for every contiguous minibatch the stochastic methods draw."""
+        return _block_gram_lambda_max(self.X, batch_size) + self.reg
+
+    def minimizer(self) -> np.ndarray:
+        """Solves the normal equations (X^T X / n + reg I) x = X^T y / n."""
+        n, d = self.X.shape
+        H = self.X.T @ self.X / n + self.reg * np.eye(d)
+        x, *_ = np.linalg.lstsq(H, self.X.T @ self.y / n, rcond=None)
+        return x
+
+
+@dataclass(frozen=True)
+class LogisticFiniteSum:
+    """
+    f(x) = (1/n) sum_i log(1 + exp(-y_i a_i^T x)) + 0.5 reg ||x||^2,  y_i in {-1, +1}
+
+    Same row layout and minibatch oracles as LeastSquaresFiniteSum.
+    """
+    X: np.ndarray
+    y: np.ndarray
+    reg: float = 0.0
+
+    def __post_init__(self) -> None:
+        X, y = _c_contiguous_rows(self.X, self.y)
+        object.__setattr__(self, "X", X)
+        object.__setattr__(self, "y", y)
+
+    @property
+    def n_samples(self) -> int:
+        return self.X.shape[0]
+
+    def f_batch(self, x: np.ndarray, start: int, stop: int) -> float:
+        x = np.asarray(x, float)
+        margins = self.y[start:stop] * (self.X[start:stop] @ x)
+        return float(np.logaddexp(0.0, -margins).mean() + 0.5 * self.reg * (x @ x))
+
+    def grad_batch(self, x: np.ndarray, start: int, stop: int) -> np.ndarray:
+        x = np.asarray(x, float)
+        Xb = self.X[start:stop]
+        yb = self.y[start:stop]
+        # d/dm log(1 + e^{-m}) = -sigmoid(-m), evaluated without overflow
+        w = -yb * np.exp(-np.logaddexp(0.0, yb * (Xb @ x)))
+        return Xb.T @ w / yb.shape[0] + self.reg * x
+
+    def f(self, x: np.ndarray) -> float:
+        return self.f_batch(x, 0, self.n_samples)
+
+    def grad(self, x: np.ndarray) -> np.ndarray:
+        return self.grad_batch(x, 0, self.n_samples)
+
+    def smoothness(self) -> float:
+        """L of the full objective: lambda_max(X^T X) / (4n) + reg."""
+        return float(np.linalg.eigvalsh(self.X.T @ self.X).max() / (4.0 * self.n_samples) + self.reg)
+
+    def batch_smoothness(self, batch_size: int) -> float:
+        """Smoothness bound for every contiguous minibatch the stochastic methods draw."""
+        return _block_gram_lambda_max(self.X, batch_size) / 4.0 + self.reg
@@ -1,5 +1,15 @@
 from .gd import gradient_descent_fixed
 from .heavy_ball import heavy_ball
 from .nesterov import nesterov_strongly_convex, nesterov_convex
+from .stochastic import stochastic_heavy_ball, stochastic_nesterov, svrg, katyusha
 
-__all__ = ["gradient_descent_fixed", "heavy_ball", "nesterov_strongly_convex", "nesterov_convex"]
+__all__ = [
+    "gradient_descent_fixed",
+    "heavy_ball",
+    "nesterov_strongly_convex",
+    "nesterov_convex",
+    "stochastic_heavy_ball",
+    "stochastic_nesterov",
+    "svrg",
+    "katyusha",
+]
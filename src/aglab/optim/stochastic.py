@@ -0,0 +1,194 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable
+import numpy as np
+
+@dataclass
+class History:
+    """
+    One record per epoch (the full objective is only evaluated there).
+    passes[k] counts component-gradient evaluations so far, in units of n.
+    """
+    xs: np.ndarray
+    fvals: np.ndarray
+    n_iter: int
+    passes: np.ndarray
+
+GradBatch = Callable[[np.ndarray, int, int], np.ndarray]
+
+def _shuffled_blocks(n_samples: int, batch_size: int, rng: np.random.Generator) -> list[tuple[int, int]]:
+    """Contiguous row blocks [start, stop) of size batch_size (last may be shorter), in random order."""
+    starts = np.arange(0, n_samples, batch_size)
+    return [(int(s), int(min(s + batch_size, n_samples))) for s in starts[rng.permutation(starts.size)]]
+
+def stochastic_heavy_ball(
+    f: Callable[[np.ndarray], float],
+    grad_batch: GradBatch,
+    n_samples: int,
+    x0: np.ndarray,
+    alpha: float,
+    beta: float,
+    batch_size: int,
+    max_epochs: int,
+    stop: Callable[[int, np.ndarray, float], bool],
+    seed: int = 0,
+) -> History:
+    """Heavy-ball with minibatch gradients; beta=0 is plain minibatch SGD."""
+    rng = np.random.default_rng(seed)
+    x = np.asarray(x0, float).copy()
+    x_prev = x.copy()
+
+    xs = [x.copy()]
+    fvals = [float(np.asarray(f(x)))]
+    passes = [0.0]
+
+    k = 0
+    while k < max_epochs and not stop(k, x, fvals[-1]):
+        for start, end in _shuffled_blocks(n_samples, batch_size, rng):
+            x_next = x - alpha * grad_batch(x, start, end) + beta * (x - x_prev)
+            x_prev = x
+            x = x_next
+
+        xs.append(x.copy())
+        fvals.append(float(np.asarray(f(x))))
+        passes.append(passes[-1] + 1.0)
+        k += 1
+
+    return History(xs=np.asarray(xs), fvals=np.asarray(fvals), n_iter=k, passes=np.asarray(passes))
+
+def stochastic_nesterov(
+    f: Callable[[np.ndarray], float],
+    grad_batch: GradBatch,
+    n_samples: int,
+    x0: np.ndarray,
+    alpha: float,
+    beta: float,
+    batch_size: int,
+    max_epochs: int,
+    stop: Callable[[int, np.ndarray, float], bool],
+    seed: int = 0,
+) -> History:
+    """nesterov_strongly_convex with the gradient at y_k replaced by a minibatch gradient."""
+    rng = np.random.default_rng(seed)
+    x = np.asarray(x0, float).copy()
+    x_prev = x.copy()
+
+    xs = [x.copy()]
+    fvals = [float(np.asarray(f(x)))]
+    passes = [0.0]
+
+    k = 0
+    while k < max_epochs and not stop(k, x, fvals[-1]):
+        for start, end in _shuffled_blocks(n_samples, batch_size, rng):
+            y = x + beta * (x - x_prev)
+            x_next = y - alpha * grad_batch(y, start, end)
+            x_prev = x
+            x = x_next
+
+        xs.append(x.copy())
+        fvals.append(float(np.asarray(f(x))))
+        passes.append(passes[-1] + 1.0)
+        k += 1
+
+    return History(xs=np.asarray(xs), fvals=np.asarray(fvals), n_iter=k, passes=np.asarray(passes))
+
+def svrg(
+    f: Callable[[np.ndarray], float],
+    grad_batch: GradBatch,
+    n_samples: int,
+    x0: np.ndarray,
+    alpha: float,
+    batch_size: int,
+    max_epochs: int,
+    stop: Callable[[int, np.ndarray, float], bool],
+    seed: int = 0,
+) -> History:
+    """
+    SVRG (Johnson & Zhang, 2013), snapshot = last inner iterate.
+
+    Each epoch takes a full gradient at the snapshot x~, then one shuffled pass of
+    g = grad_B(x) - grad_B(x~) + grad(x~),   x <- x - alpha g.
+    alpha ~ 1/(4 L_B) with L_B bounding the smoothness of every minibatch.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.asarray(x0, float).copy()
+
+    xs = [x.copy()]
+    fvals = [float(np.asarray(f(x)))]
+    passes = [0.0]
+
+    k = 0
+    while k < max_epochs and not stop(k, x, fvals[-1]):
+        x_snap = x.copy()
+        g_snap = grad_batch(x_snap, 0, n_samples)
+        for start, end in _shuffled_blocks(n_samples, batch_size, rng):
+            g = grad_batch(x, start, end) - grad_batch(x_snap, start, end) + g_snap
+            x = x - alpha * g
+
+        xs.append(x.copy())
+        fvals.append(float(np.asarray(f(x))))
+        passes.append(passes[-1] + 3.0)
+        k += 1
+
+    return History(xs=np.asarray(xs), fvals=np.asarray(fvals), n_iter=k, passes=np.asarray(passes))
+
+def katyusha(
+    f: Callable[[np.ndarray], float],
+    grad_batch: GradBatch,
+    n_samples: int,
+    x0: np.ndarray,
+    L: float,
+    mu: float,
+    batch_size: int,
+    max_epochs: int,
+    stop: Callable[[int, np.ndarray, float], bool],
+    seed: int = 0,
+) -> History:
+    """
+    Katyusha (Allen-Zhu, 2017) for mu-strongly convex f: SVRG plus Nesterov
+    momentum (tau1) and a "negative momentum" pull towards the snapshot (tau2).
+
+    L must bound the smoothness of every minibatch. An epoch runs m = 2 * n_blocks
+    inner steps, and the next snapshot is the (1 + alpha mu)^j-weighted average of y.
+    """
+    if mu <= 0.0:
+        raise ValueError("katyusha needs mu > 0 (add reg to the objective)")
+    rng = np.random.default_rng(seed)
+    n_blocks = -(-n_samples // batch_size)
+    m = 2 * n_blocks
+    tau2 = 0.5
+    tau1 = min(np.sqrt(m * mu / (3.0 * L)), 0.5)
+    alpha = 1.0 / (3.0 * tau1 * L)
+
+    x_snap = np.asarray(x0, float).copy()
+    y = x_snap.copy()
+    z = x_snap.copy()
+
+    xs = [x_snap.copy()]
+    fvals = [float(np.asarray(f(x_snap)))]
+    passes = [0.0]
+
+    k = 0
+    while k < max_epochs and not stop(k, x_snap, fvals[-1]):
+        g_snap = grad_batch(x_snap, 0, n_samples)
+        blocks = _shuffled_blocks(n_samples, batch_size, rng) + _shuffled_blocks(n_samples, batch_size, rng)
+
+        y_sum = np.zeros_like(x_snap)
+        w, w_sum = 1.0, 0.0
+        for start, end in blocks:
+            x = tau1 * z + tau2 * x_snap + (1.0 - tau1 - tau2) * y
+            g = grad_batch(x, start, end) - grad_batch(x_snap, start, end) + g_snap
+            z = z - alpha * g
+            y = x - g / (3.0 * L)
+
+            y_sum += w * y
+            w_sum += w
+            w *= 1.0 + alpha * mu
+        x_snap = y_sum / w_sum
+
+        xs.append(x_snap.copy())
+        fvals.append(float(np.asarray(f(x_snap))))
+        passes.append(passes[-1] + 5.0)
+        k += 1
+
+    return History(xs=np.asarray(xs), fvals=np.asarray(fvals), n_iter=k, passes=np.asarray(passes))
@@ -1,3 +1,3 @@
-from .lines import semilog_lines, line_plot
+from .lines import semilog_lines, line_plot, semilog_xy
 
-__all__ = ["semilog_lines", "line_plot"]
+__all__ = ["semilog_lines", "line_plot", "semilog_xy"]
@@ -24,3 +24,14 @@ def line_plot(series: dict[str, np.ndarray], outpath: Path, ylabel: str) -> None
     plt.legend()
     fig.savefig(outpath, dpi=200, bbox_inches="tight")
     plt.close(fig)
+
+def semilog_xy(series: dict[str, tuple[np.ndarray, np.ndarray]], outpath: Path, xlabel: str, ylabel: str) -> None:
+    fig = plt.figure()
+    for label, (x, y) in series.items():
+        yy = np.maximum(np.asarray(y, float).ravel(), 1e-300)  # avoid log(0)
+        plt.semilogy(np.asarray(x, float).ravel(), yy, label=label)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    plt.legend()
+    fig.savefig(outpath, dpi=200, bbox_inches="tight")
+    plt.close(fig)
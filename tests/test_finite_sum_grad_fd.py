@@ -0,0 +1,30 @@
+from __future__ import annotations
+from pathlib import Path
+import sys
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from aglab.objectives.finite_sum import LeastSquaresFiniteSum, LogisticFiniteSum
+
+def test_finite_sum_batch_grads_match_fd_and_average_to_full() -> None:
+    rng = np.random.default_rng(3)
+    n, d = 40, 6
+    X = rng.standard_normal((n, d))
+    y = rng.standard_normal((n,))
+    x = rng.standard_normal((d,))
+
+    for obj in [LeastSquaresFiniteSum(X=X, y=y, reg=0.1), LogisticFiniteSum(X=X, y=np.sign(y), reg=0.1)]:
+        assert np.shares_memory(obj.X[8:16], obj.X)
+
+        g = obj.grad_batch(x, 8, 16)
+        eps = 1e-6
+        gfd = np.zeros_like(g)
+        for i in range(d):
+            e = np.zeros(d); e[i] = 1.0
+            gfd[i] = (obj.f_batch(x + eps * e, 8, 16) - obj.f_batch(x - eps * e, 8, 16)) / (2 * eps)
+        assert np.allclose(g, gfd, atol=1e-5, rtol=1e-5)
+
+        g_blocks = np.mean([obj.grad_batch(x, s, s + 10) for s in range(0, n, 10)], axis=0)
+        assert np.allclose(g_blocks, obj.grad(x))
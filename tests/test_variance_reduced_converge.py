@@ -0,0 +1,31 @@
+from __future__ import annotations
+from pathlib import Path
+import sys
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "src"))
+
+from aglab.objectives.finite_sum import LeastSquaresFiniteSum
+from aglab.optim.stochastic import svrg, katyusha
+
+def test_svrg_and_katyusha_reach_small_gap() -> None:
+    rng = np.random.default_rng(5)
+    n, d = 500, 10
+    X = rng.standard_normal((n, d))
+    y = X @ rng.standard_normal((d,)) + 0.1 * rng.standard_normal((n,))
+    obj = LeastSquaresFiniteSum(X=X, y=y, reg=1e-2)
+    f_star = obj.f(obj.minimizer())
+
+    batch_size = 25
+    L_B = obj.batch_smoothness(batch_size)
+    mu = float(np.linalg.eigvalsh(X.T @ X / n).min()) + obj.reg
+
+    x0 = np.zeros((d,))
+    stop = lambda k, x, fx: (fx - f_star) <= 1e-10
+    hist_svrg = svrg(obj.f, obj.grad_batch, n, x0, alpha=1.0 / (4.0 * L_B), batch_size=batch_size, max_epochs=100, stop=stop)
+    hist_katy = katyusha(obj.f, obj.grad_batch, n, x0, L=L_B, mu=mu, batch_size=batch_size, max_epochs=100, stop=stop)
+
+    assert hist_svrg.fvals[-1] - f_star <= 1e-10
+    assert hist_katy.fvals[-1] - f_star <= 1e-10
+    assert hist_svrg.passes[-1] == 3.0 * hist_svrg.n_iter